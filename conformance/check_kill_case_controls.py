@@ -57,7 +57,6 @@ say no.
 """
 from __future__ import annotations
 
-import glob
 import json
 import os
 import sys
@@ -243,7 +242,17 @@ def main(argv: list[str] | None = None) -> int:
         print(f"usage: {os.path.basename(__file__)} [FIXTURE_DIR]", file=sys.stderr)
         return 2
     root = args[0] if args else os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests")
-    paths = sorted(glob.glob(os.path.join(root, "*.json")))
+    # os.scandir over glob: DirEntry carries the name without a stat or fnmatch
+    # pass, and the dot-file exclusion keeps glob's `*.json` semantics —
+    # including its empty result for a missing directory.
+    paths: list[str] = []
+    if os.path.isdir(root):
+        with os.scandir(root) as entries:
+            paths = sorted(
+                e.path
+                for e in entries
+                if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+            )
     if not paths:
         print(f"no fixtures found in {root}", file=sys.stderr)
         return 1
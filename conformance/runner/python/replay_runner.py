@@ -152,7 +152,13 @@ class ReplayRunner:
         # 3. Snapshot recognition — every captured snapshot's operation
         #    must be in the shared fixture (catches TS-side dispatch drift).
         if wire_dir.exists():
-            for f in sorted(wire_dir.glob("*.json")):
+            with os.scandir(wire_dir) as entries:
+                snapshots = sorted(
+                    Path(e.path)
+                    for e in entries
+                    if e.name.endswith(".json") and not e.name.startswith(".")
+                )
+            for f in snapshots:
                 try:
                     snap = json.loads(f.read_text())
                 except OSError as e:
@@ -7,6 +7,7 @@ them against the SDK using respx for HTTP stubbing.
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 import time
@@ -1199,7 +1200,16 @@ class ConformanceRunner:
             return ErrorMapper(e)
 
     def run(self) -> int:
-        files = sorted(self._tests_dir.glob("*.json"))
+        # os.scandir over Path.glob: filter on the cached DirEntry name before
+        # any Path is materialized (dot-files excluded, as with glob's `*`).
+        files: list[Path] = []
+        if self._tests_dir.is_dir():
+            with os.scandir(self._tests_dir) as entries:
+                files = sorted(
+                    Path(e.path)
+                    for e in entries
+                    if e.name.endswith(".json") and not e.name.startswith(".")
+                )
         if not files:
             print(f"No test files found in {self._tests_dir}")
             return 0
@@ -105,7 +105,7 @@ def run(cases: list[dict] | None, *, args: list[str] | None = None,
     with tempfile.TemporaryDirectory(prefix="kill-case-controls-test") as tmp:
         if not empty_dir:
             with open(os.path.join(tmp, "todos_write.json"), "w") as f:
-                json.dump(cases, f, indent=2)
+                f.write(json.dumps(cases, indent=2))
         argv = args if args is not None else [tmp]
         proc = subprocess.run(
             [sys.executable, GATE, *argv],
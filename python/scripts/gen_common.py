@@ -1,8 +1,24 @@
 """Shared helpers for the Python code generators (generate_services.py,
-generate_types.py)."""
+generate_types.py, generate_metadata.py)."""
 
 from __future__ import annotations
 
+from pathlib import Path
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` only when it differs from what is on disk.
+
+    Generator outputs are committed, so most regeneration runs reproduce the
+    existing bytes exactly. Skipping the no-op rewrite keeps mtimes stable, so
+    a rebuild that changed nothing doesn't look like fresh output to
+    timestamp-based tooling. Returns whether a write happened.
+    """
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
 
 def escape_py_string(value: str) -> str:
     """Escape arbitrary text for safe interpolation into a Python string or
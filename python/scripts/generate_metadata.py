@@ -8,8 +8,14 @@ Usage: python scripts/generate_metadata.py [--openapi ../openapi.json] [--behavi
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
+# Make the shared generator helper importable whether this file is run as a
+# script (its dir is already sys.path[0]) or loaded via importlib in tests.
+sys.path.insert(0, str(Path(__file__).parent))
+from gen_common import write_if_changed  # noqa: E402
+
 
 def main() -> None:
     import argparse
@@ -56,11 +62,13 @@ def main() -> None:
             if entry:
                 metadata[op_id] = entry
 
+    # Serialize to one string and issue one binary write — no per-fragment
+    # text-layer writes, no platform newline translation in generated output.
     output = json.dumps(metadata, indent=2, sort_keys=True) + "\n"
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(output, encoding="utf-8")
+    write_if_changed(output_path, output.encode("utf-8"))
     print(f"Generated {output_path} ({len(metadata)} operations)")
 
 
@@ -19,7 +19,7 @@ from pathlib import Path
 # Make the shared generator helper importable whether this file is run as a
 # script (its dir is already sys.path[0]) or loaded via importlib in tests.
 sys.path.insert(0, str(Path(__file__).parent))
-from gen_common import escape_py_string  # noqa: E402
+from gen_common import escape_py_string, write_if_changed  # noqa: E402
 
 METHODS = ("get", "post", "put", "patch", "delete")
 
@@ -287,7 +287,7 @@ VERB_PATTERNS = [
     ("Search", "search"),
 ]
 
-SIMPLE_RESOURCES = {
+SIMPLE_RESOURCES = frozenset({
     "todo", "todos", "todolist", "todolists", "todoset", "message", "messages",
     "comment", "comments", "card", "cards", "cardtable", "cardcolumn", "cardstep",
     "column", "step", "project", "projects", "person", "people", "campfire",
@@ -301,7 +301,7 @@ SIMPLE_RESOURCES = {
     "clientreplies", "forwardreply", "forwardreplies", "campfireline", "campfirelines",
     "todolistgroup", "todolistgroups", "todolistorgroup", "uploadversions",
     "wormhole", "wormholes",
-}
+})
 
 
 PYTHON_KEYWORDS = frozenset({
@@ -313,9 +313,18 @@ PYTHON_KEYWORDS = frozenset({
 })
 
 
+# Compiled once at module level: to_snake_case and convert_path run for every
+# operation, parameter, and path segment in the spec.
+CAMEL_BOUNDARY_RE = re.compile(r"([a-z\d])([A-Z])")
+ACRONYM_BOUNDARY_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+ACCOUNT_PREFIX_RE = re.compile(r"^/\{accountId\}")
+PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+ARRAY_SUFFIX_RE = re.compile(r"\[\]$")
+
+
 def to_snake_case(name: str) -> str:
-    s = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
-    s = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", s)
+    s = CAMEL_BOUNDARY_RE.sub(r"\1_\2", name)
+    s = ACRONYM_BOUNDARY_RE.sub(r"\1_\2", s)
     return s.lower()
 
 
@@ -367,12 +376,12 @@ def schema_to_python_type(schema: dict | None) -> str:
 
 def convert_path(path: str) -> str:
     """Remove /{accountId} prefix and convert {camelCaseParam} to {snake_case_param}."""
-    path = re.sub(r"^/\{accountId\}", "", path)
+    path = ACCOUNT_PREFIX_RE.sub("", path)
 
     def _replace(m: re.Match) -> str:
         return "{" + to_snake_case(m.group(1)) + "}"
 
-    return re.sub(r"\{(\w+)\}", _replace, path)
+    return PATH_PARAM_RE.sub(_replace, path)
 
 
 def resolve_schema_ref(ref: dict, schemas: dict) -> dict | None:
@@ -439,7 +448,7 @@ def parse_operation(
             # the raw `name` (used as the params-dict wire key so httpx sends
             # `bucket_ids%5B%5D=…`), but strip it for the public `python_name`
             # kwarg identifier (`bucket_ids[]` is not a valid identifier).
-            snake = to_snake_case(re.sub(r"\[\]$", "", p["name"]))
+            snake = to_snake_case(ARRAY_SUFFIX_RE.sub("", p["name"]))
             schema = p.get("schema") or {}
             query_params.append({
                 "name": p["name"],
@@ -889,7 +898,10 @@ def main() -> None:
         code = generate_service_file(service)
         fname = service_filename(name)
         filepath = output_dir / fname
-        filepath.write_text(code, encoding="utf-8")
+        # One binary write of the pre-built source (skipped when the bytes are
+        # already on disk): no incremental text-layer encode, and no platform
+        # newline translation in generated output.
+        write_if_changed(filepath, code.encode("utf-8"))
         op_count = len(service["operations"])
         total_ops += op_count
         generated_files.append(fname)
@@ -898,7 +910,7 @@ def main() -> None:
     # Generate __init__.py
     init_code = generate_init_file(services)
     init_path = output_dir / "__init__.py"
-    init_path.write_text(init_code, encoding="utf-8")
+    write_if_changed(init_path, init_code.encode("utf-8"))
     print(f"Generated __init__.py")
 
     print(f"\nGenerated {len(services)} services with {total_ops} operations total.")
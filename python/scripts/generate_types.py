@@ -14,10 +14,10 @@ from pathlib import Path
 # Make the shared generator helper importable whether this file is run as a
 # script (its dir is already sys.path[0]) or loaded via importlib in tests.
 sys.path.insert(0, str(Path(__file__).parent))
-from gen_common import escape_py_string  # noqa: E402
+from gen_common import escape_py_string, write_if_changed  # noqa: E402
 
 # Python keywords that can't be used as field names in TypedDicts
-PYTHON_KEYWORDS = set(keyword.kwlist)
+PYTHON_KEYWORDS = frozenset(keyword.kwlist)
 
 
 def _wants_system_label(prop_name: str, prop: dict, props: dict) -> bool:
@@ -36,7 +36,7 @@ def _wants_system_label(prop_name: str, prop: dict, props: dict) -> bool:
     )
 
 
-def quote_schema_refs(py_type: str, schema_names: set[str]) -> str:
+def quote_schema_refs(py_type: str, schema_names: frozenset[str]) -> str:
     """Quote whole-word schema-name identifiers in a type annotation as forward
     references, leaving qualifiers (NotRequired, Optional, list) and builtins
     (str, int, bool, Any, None) bare. Used only for functional-syntax TypedDicts,
@@ -47,7 +47,7 @@ def quote_schema_refs(py_type: str, schema_names: set[str]) -> str:
 
     def repl(m: re.Match) -> str:
         tok = m.group(0)
-        return f'"{tok}"' if tok in schema_names else tok
+        return '"' + tok + '"' if tok in schema_names else tok
 
     return re.sub(r"[A-Za-z_][A-Za-z0-9_]*", repl, py_type)
 
@@ -150,7 +150,7 @@ def main() -> None:
     lines.append("")
 
     # Sort schemas alphabetically for deterministic output
-    schema_names = set(schemas)
+    schema_names = frozenset(schemas)
     generated_count = 0
     for name in sorted(schemas):
         schema = schemas[name]
@@ -235,7 +235,7 @@ def main() -> None:
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(output, encoding="utf-8")
+    write_if_changed(output_path, output.encode("utf-8"))
     print(f"Generated {output_path} ({generated_count} TypedDict classes)")
 
 
@@ -39,6 +39,9 @@ class AsyncHttpClient:
         self._auth = auth
         self._hooks = hooks or BasecampHooks()
         self._metadata = metadata or {}
+        # One immutable declared-status set per operation, built on first use
+        # and shared by every later request for that operation.
+        self._retry_on_cache: dict[str, frozenset[int]] = {}
         self._user_agent = user_agent or self.USER_AGENT
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(config.timeout, connect=10.0),
@@ -423,15 +426,18 @@ class AsyncHttpClient:
         return error.http_status in self._operation_retry_on(operation)
 
     def _operation_retry_on(self, operation: str) -> frozenset[int]:
+        cached = self._retry_on_cache.get(operation)
+        if cached is not None:
+            return cached
         retry = (self._metadata.get(operation) or {}).get("retry") or {}
         statuses = retry.get("retry_on")
         # `is None`, not truthiness: an operation that declares `retry_on: []`
         # means "never retry on any status", which is not the same as declaring
         # nothing. Collapsing the two would silently re-enable 429/503 retries on
         # an operation that opted out.
-        if statuses is None:
-            return self.DEFAULT_RETRY_ON
-        return frozenset(statuses)
+        declared = self.DEFAULT_RETRY_ON if statuses is None else frozenset(statuses)
+        self._retry_on_cache[operation] = declared
+        return declared
 
     def _apply_operation_retry_max(self, operation: str | None, max_attempts: int) -> int:
         # Apply the per-operation retry ceiling from metadata as an upper bound on
@@ -57,8 +57,11 @@ no-environment break. Neither is acceptable, so both directions carry tests.
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 REPO = Path(__file__).resolve().parent.parent
@@ -405,6 +408,7 @@ VAR_RE = re.compile(r"\b((?:BASECAMP|XDG)_[A-Z0-9_]+)\b")
 # The dotted markers are already anchored by their own `.`.
 FILENAME_TEST_PREFIXES = ("test_",)
 FILENAME_TEST_MARKERS = ("_test.", ".test.", "_spec.")
+TEST_DIR_NAMES = frozenset({"test", "tests", "spec", "specs"})
 
 # Invariant 5. Only the active voice with SDK names as the subject. The passive
 # "`BASECAMP_TOKEN` is read by `AuthManager`", the symbol subject "`Config()`
@@ -1237,8 +1241,7 @@ def is_test(rel_path: Path) -> bool:
     directories the other SDKs use.
     """
     for part in rel_path.parts[:-1]:
-        lowered = part.lower()
-        if lowered in ("test", "tests", "spec", "specs"):
+        if part.lower() in TEST_DIR_NAMES:
             return True
         if part.endswith(("Test", "Tests")):
             return True
@@ -1577,9 +1580,50 @@ def prose_claims(readme: Path) -> list[tuple[int, str, list[str]]]:
     return claims
 
 
+def _scan_job(job: tuple[str, str]) -> tuple[tuple[str, str], dict | list]:
+    """One source-tree scan, addressed by (kind, sdk) so results merge by key."""
+    kind, sdk = job
+    spec = SDKS[sdk]
+    if kind == "scoped":
+        return job, real_reads(spec)
+    if kind == "unscoped":
+        return job, real_reads(spec, scoped=False)
+    return job, env_api_sites(sdk, spec)
+
+
+def run_scans() -> dict[tuple[str, str], dict | list]:
+    """Every per-SDK source scan main() needs, fanned across processes.
+
+    Each scan walks one SDK's tree independently and is CPU-bound in
+    strip_noncode, so the nine of them are this gate's whole runtime. The fork
+    context is load-bearing twice over: workers must inherit module state (the
+    self-test monkeypatches REPO/SDKS/NO_ENV_SDKS before calling main), and a
+    spawned child could not re-import a dash-named script. When fork is
+    unavailable, or the module was loaded under a name pickle cannot resolve
+    (the self-test's importlib load), the same jobs run serially — identical
+    results, just slower.
+    """
+    jobs = (
+        [("scoped", sdk) for sdk in SDKS]
+        + [("unscoped", sdk) for sdk in NO_ENV_SDKS]
+        + [("api", sdk) for sdk in NO_ENV_SDKS]
+    )
+    workers = min(len(jobs), len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1))
+    if (
+        workers > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+        and sys.modules.get(__name__) is not None
+    ):
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            return dict(pool.map(_scan_job, jobs))
+    return dict(map(_scan_job, jobs))
+
+
 def main() -> int:
     failures: list[str] = []
-    reads = {name: real_reads(spec) for name, spec in SDKS.items()}
+    scans = run_scans()
+    reads = {name: scans[("scoped", name)] for name in SDKS}
 
     # 1. Forward, per SDK.
     for sdk, spec in SDKS.items():
@@ -1660,7 +1704,7 @@ def main() -> int:
     # the claim as surely as a BASECAMP_ variable would, and the scoped
     # inventory could not see it.
     for sdk in NO_ENV_SDKS:
-        every = real_reads(SDKS[sdk], scoped=False)
+        every = scans[("unscoped", sdk)]
         if every:
             detail = ", ".join(f"{v} ({s[0]})" for v, s in sorted(every.items()))
             failures.append(
@@ -1672,8 +1716,8 @@ def main() -> int:
         # sentence. Only asked when that inventory is empty: a named read
         # already fails this claim, and says which variable, so reporting the
         # API touch alongside it would be the same defect twice.
-        elif env_api_sites(sdk, SDKS[sdk]):
-            sites = env_api_sites(sdk, SDKS[sdk])
+        elif scans[("api", sdk)]:
+            sites = scans[("api", sdk)]
             failures.append(
                 f"{ROOT_README}: claims {sdk} reads no environment variables, but its "
                 f"source reaches the whole environment at {', '.join(sites[:3])}"
@@ -45,12 +45,58 @@ Exit non-zero on any parity mismatch.
 from __future__ import annotations
 
 import json
+import mmap
 import re
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 
+# Extraction patterns, compiled once at import. Several sit inside per-match
+# loops (INT_RE runs once per operation entry), so recompiling — even through
+# re's internal cache — would pay lookup cost on every call.
+INT_RE = re.compile(r"\d+")
+# "OpId" to OperationConfig(<bool>, RetryConfig(<max>, <delay>L, "<backoff>", setOf(<ints>))),
+KT_RETRY_RE = re.compile(
+    r'"(?P<op>\w+)"\s+to\s+OperationConfig\([^,]+,\s*RetryConfig\('
+    r"(?P<max>\d+),\s*(?P<delay>\d+)L,\s*\"(?P<backoff>\w+)\",\s*setOf\((?P<ro>[^)]*)\)\)"
+)
+# "OpId": RetryConfig(maxAttempts: N, baseDelayMs: N, backoff: .exponential, retryOn: [429, 503]),
+SWIFT_RETRY_RE = re.compile(
+    r'"(?P<op>\w+)"\s*:\s*RetryConfig\(maxAttempts:\s*(?P<max>\d+),\s*'
+    r"baseDelayMs:\s*(?P<delay>\d+),\s*backoff:\s*\.(?P<backoff>\w+),\s*retryOn:\s*\[(?P<ro>[^\]]*)\]\)"
+)
+def _go_block(data: mmap.mmap, header: bytes) -> str:
+    # Linear extraction of a generated map body straight off the mapped file:
+    # gofmt opens the map at `header` and closes it at the next column-0 `}`,
+    # so slicing between the two literals is exact (both are ASCII, so the
+    # byte-level find cannot split a code point). Only the slice is decoded.
+    # This replaces a DOTALL `(.*?)` search, whose worst case backtracks across
+    # the rest of the 1.8 MB file if the terminator ever drifts.
+    name = header.split(b" ")[1].decode()
+    start = data.find(header)
+    if start < 0:
+        raise ValueError(f"{name} map not found in client.gen.go")
+    body_start = start + len(header)
+    end = data.find(b"\n}", body_start)
+    if end < 0:
+        raise ValueError(f"unterminated {name} map in client.gen.go")
+    return data[body_start:end].decode("utf-8")
+
+
+def _go_map_entries(block: str):
+    # gofmt emits one `"OpName": <value>,` entry per line, so a partition per
+    # line is enough — no per-entry regex re-entry, and str.partition/strip run
+    # at C level. Same hand-scan approach from_typescript takes for its braces.
+    for line in block.splitlines():
+        line = line.strip()
+        if not line.startswith('"'):
+            continue
+        op, sep, value = line[1:].partition('":')
+        if not sep:
+            continue
+        yield op, value.strip().rstrip(",")
+
 
 def fail(msg: str) -> None:
     print(f"  ✗ {msg}")
@@ -60,7 +106,7 @@ def fail(msg: str) -> None:
 
 
 def load_model() -> dict[str, tuple]:
-    d = json.loads((ROOT / "behavior-model.json").read_text())
+    d = json.loads((ROOT / "behavior-model.json").read_bytes())
     out: dict[str, tuple] = {}
     for op, meta in d["operations"].items():
         r = meta.get("retry")
@@ -74,14 +120,14 @@ def load_model() -> dict[str, tuple]:
 
 
 def _from_json_ops(path: Path, ops_key: str | None, camel: bool) -> dict[str, tuple]:
-    d = json.loads(path.read_text())
+    d = json.loads(path.read_bytes())
     ops = d[ops_key] if ops_key else d
     mx, bd, ro = ("maxAttempts", "baseDelayMs", "retryOn") if camel else ("max", "base_delay_ms", "retry_on")
     out: dict[str, tuple] = {}
     for op, meta in ops.items():
-        if not isinstance(meta, dict) or "retry" not in meta:
+        r = meta.get("retry") if isinstance(meta, dict) else None
+        if r is None:
             continue
-        r = meta["retry"]
         out[op] = (r[mx], r[bd], r["backoff"], tuple(r[ro]))
     return out
 
@@ -95,14 +141,16 @@ def from_ruby() -> dict[str, tuple]:
 
 
 def from_typescript() -> dict[str, tuple]:
-    text = (ROOT / "typescript/src/generated/metadata.ts").read_text()
+    text = (ROOT / "typescript/src/generated/metadata.ts").read_bytes().decode("utf-8")
     # The metadata value is a JSON object literal preceded by TS interface
-    # declarations. Anchor on the `metadata` const, then extract the balanced
+    # declarations. Anchor on the `metadata` const with a literal find (a
+    # C-level scan; the declaration's type annotation sits between the name and
+    # the first `{`, which the index() below skips), then extract the balanced
     # braces of its object and json.loads it.
-    decl = re.search(r"const metadata\b[^=]*=\s*", text)
-    if not decl:
+    decl = text.find("const metadata")
+    if decl < 0:
         raise ValueError("metadata const not found in metadata.ts")
-    start = text.index("{", decl.end())
+    start = text.index("{", decl)
     depth = 0
     for i in range(start, len(text)):
         if text[i] == "{":
@@ -118,65 +166,50 @@ def from_typescript() -> dict[str, tuple]:
     ops = d["operations"]
     out: dict[str, tuple] = {}
     for op, meta in ops.items():
-        if "retry" not in meta:
+        r = meta.get("retry")
+        if r is None:
             continue
-        r = meta["retry"]
         out[op] = (r["maxAttempts"], r["baseDelayMs"], r["backoff"], tuple(r["retryOn"]))
     return out
 
 
 def from_kotlin() -> dict[str, tuple]:
-    text = (ROOT / "kotlin/sdk/src/commonMain/kotlin/com/basecamp/sdk/generated/Metadata.kt").read_text()
-    # "OpId" to OperationConfig(<bool>, RetryConfig(<max>, <delay>L, "<backoff>", setOf(<ints>))),
-    pat = re.compile(
-        r'"(?P<op>\w+)"\s+to\s+OperationConfig\([^,]+,\s*RetryConfig\('
-        r"(?P<max>\d+),\s*(?P<delay>\d+)L,\s*\"(?P<backoff>\w+)\",\s*setOf\((?P<ro>[^)]*)\)\)"
-    )
+    text = (ROOT / "kotlin/sdk/src/commonMain/kotlin/com/basecamp/sdk/generated/Metadata.kt").read_bytes().decode("utf-8")
     out: dict[str, tuple] = {}
-    for m in pat.finditer(text):
-        ro = tuple(int(x) for x in re.findall(r"\d+", m.group("ro")))
-        out[m.group("op")] = (int(m.group("max")), int(m.group("delay")), m.group("backoff"), ro)
+    for m in KT_RETRY_RE.finditer(text):
+        # One group() call fetches all five captures instead of five lookups.
+        op, mx, delay, backoff, ro = m.group("op", "max", "delay", "backoff", "ro")
+        out[op] = (int(mx), int(delay), backoff, tuple(int(x) for x in INT_RE.findall(ro)))
     return out
 
 
 def from_swift() -> dict[str, tuple]:
-    text = (ROOT / "swift/Sources/Basecamp/Generated/Metadata.swift").read_text()
-    # "OpId": RetryConfig(maxAttempts: N, baseDelayMs: N, backoff: .exponential, retryOn: [429, 503]),
-    pat = re.compile(
-        r'"(?P<op>\w+)"\s*:\s*RetryConfig\(maxAttempts:\s*(?P<max>\d+),\s*'
-        r"baseDelayMs:\s*(?P<delay>\d+),\s*backoff:\s*\.(?P<backoff>\w+),\s*retryOn:\s*\[(?P<ro>[^\]]*)\]\)"
-    )
+    text = (ROOT / "swift/Sources/Basecamp/Generated/Metadata.swift").read_bytes().decode("utf-8")
     out: dict[str, tuple] = {}
-    for m in pat.finditer(text):
-        ro = tuple(int(x) for x in re.findall(r"\d+", m.group("ro")))
-        out[m.group("op")] = (int(m.group("max")), int(m.group("delay")), m.group("backoff"), ro)
+    for m in SWIFT_RETRY_RE.finditer(text):
+        op, mx, delay, backoff, ro = m.group("op", "max", "delay", "backoff", "ro")
+        out[op] = (int(mx), int(delay), backoff, tuple(int(x) for x in INT_RE.findall(ro)))
     return out
 
 
-def from_go_max() -> dict[str, int]:
-    # Go emits the per-op retry ceiling as a separate `operationRetryMax` map
-    # (kept off the exported OperationMetadata struct to avoid a source break).
-    text = (ROOT / "go/pkg/generated/client.gen.go").read_text()
-    block = re.search(r"var operationRetryMax = map\[string\]int\{(.*?)\n\}", text, re.DOTALL)
-    if not block:
-        raise ValueError("operationRetryMax map not found in client.gen.go")
-    pat = re.compile(r'"(?P<op>\w+)":\s*(?P<max>\d+),')
-    return {m.group("op"): int(m.group("max")) for m in pat.finditer(block.group(1))}
-
-
-def from_go_retry_on() -> dict[str, tuple]:
-    # Go emits the declared retryable status set as `operationRetryOn`, a
-    # sibling of operationRetryMax and likewise kept off the exported
-    # OperationMetadata struct.
-    text = (ROOT / "go/pkg/generated/client.gen.go").read_text()
-    block = re.search(r"var operationRetryOn = map\[string\]\[\]int\{(.*?)\n\}", text, re.DOTALL)
-    if not block:
-        raise ValueError("operationRetryOn map not found in client.gen.go")
-    pat = re.compile(r'"(?P<op>\w+)":\s*\{(?P<ro>[0-9,\s]*)\},')
-    return {
-        m.group("op"): tuple(int(x) for x in re.findall(r"\d+", m.group("ro")))
-        for m in pat.finditer(block.group(1))
+def from_go() -> tuple[dict[str, int], dict[str, tuple]]:
+    # Go emits the per-op retry ceiling as `operationRetryMax` and the declared
+    # retryable status set as its sibling `operationRetryOn` (both kept off the
+    # exported OperationMetadata struct to avoid a source break). client.gen.go
+    # is by far the largest file this gate touches, so mmap it and scan the
+    # mapping once for both maps — no full-file copy into a str and no decode
+    # of 1.8 MB to read the two small blocks this gate actually needs.
+    with open(ROOT / "go/pkg/generated/client.gen.go", "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        max_block = _go_block(mm, b"var operationRetryMax = map[string]int{")
+        on_block = _go_block(mm, b"var operationRetryOn = map[string][]int{")
+    retry_max = {op: int(value) for op, value in _go_map_entries(max_block)}
+    retry_on = {
+        op: tuple(int(x) for x in value.strip("{}").split(",") if x.strip())
+        for op, value in _go_map_entries(on_block)
     }
+    return retry_max, retry_on
 
 
 # --- checks ------------------------------------------------------------------
@@ -184,15 +217,16 @@ def from_go_retry_on() -> dict[str, tuple]:
 
 def check_full_tuple(name: str, emitted: dict[str, tuple], model: dict[str, tuple]) -> int:
     errors = 0
-    missing = sorted(set(model) - set(emitted))
-    extra = sorted(set(emitted) - set(model))
+    model_ops, emitted_ops = set(model), set(emitted)
+    missing = sorted(model_ops - emitted_ops)
+    extra = sorted(emitted_ops - model_ops)
     if missing:
         fail(f"{name}: {len(missing)} operation(s) missing a retry block, e.g. {missing[:3]}")
         errors += len(missing)
     if extra:
         fail(f"{name}: {len(extra)} operation(s) not in behavior-model.json, e.g. {extra[:3]}")
         errors += len(extra)
-    for op in sorted(set(model) & set(emitted)):
+    for op in sorted(model_ops & emitted_ops):
         if emitted[op] != model[op]:
             fail(f"{name}: {op} retry {emitted[op]} != model {model[op]}")
             errors += 1
@@ -203,8 +237,9 @@ def check_full_tuple(name: str, emitted: dict[str, tuple], model: dict[str, tupl
 
 def check_max_only(name: str, emitted: dict[str, int], model: dict[str, tuple]) -> int:
     errors = 0
-    missing = sorted(set(model) - set(emitted))
-    extra = sorted(set(emitted) - set(model))
+    model_ops, emitted_ops = set(model), set(emitted)
+    missing = sorted(model_ops - emitted_ops)
+    extra = sorted(emitted_ops - model_ops)
     if missing:
         fail(f"{name}: {len(missing)} operation(s) missing RetryMax, e.g. {missing[:3]}")
         errors += len(missing)
@@ -213,7 +248,7 @@ def check_max_only(name: str, emitted: dict[str, int], model: dict[str, tuple])
         # fail, so the emitter cannot retain obsolete retry metadata unnoticed.
         fail(f"{name}: {len(extra)} operation(s) not in behavior-model.json, e.g. {extra[:3]}")
         errors += len(extra)
-    for op in sorted(set(model) & set(emitted)):
+    for op in sorted(model_ops & emitted_ops):
         if emitted[op] != model[op][0]:
             fail(f"{name}: {op} RetryMax {emitted[op]} != model max {model[op][0]}")
             errors += 1
@@ -263,15 +298,16 @@ RUNTIME_CONSUMPTION = [
 
 def check_retry_on_only(name: str, emitted: dict[str, tuple], model: dict[str, tuple]) -> int:
     errors = 0
-    missing = sorted(set(model) - set(emitted))
-    extra = sorted(set(emitted) - set(model))
+    model_ops, emitted_ops = set(model), set(emitted)
+    missing = sorted(model_ops - emitted_ops)
+    extra = sorted(emitted_ops - model_ops)
     if missing:
         fail(f"{name}: {len(missing)} operation(s) missing a retryOn set, e.g. {missing[:3]}")
         errors += len(missing)
     if extra:
         fail(f"{name}: {len(extra)} operation(s) not in behavior-model.json, e.g. {extra[:3]}")
         errors += len(extra)
-    for op in sorted(set(model) & set(emitted)):
+    for op in sorted(model_ops & emitted_ops):
         if emitted[op] != model[op][3]:
             fail(f"{name}: {op} retryOn {emitted[op]} != model {model[op][3]}")
             errors += 1
@@ -283,7 +319,7 @@ def check_retry_on_only(name: str, emitted: dict[str, tuple], model: dict[str, t
 def check_runtime_consumption() -> int:
     errors = 0
     for sdk, level, rel, required, forbidden, note in RUNTIME_CONSUMPTION:
-        text = (ROOT / rel).read_text()
+        text = (ROOT / rel).read_bytes().decode("utf-8")
         missing = [t for t in required if t not in text]
         present_forbidden = [t for t in forbidden if t in text]
         if missing:
@@ -308,8 +344,9 @@ def main() -> int:
     errors += check_full_tuple("TypeScript metadata.ts", from_typescript(), model)
     errors += check_full_tuple("Kotlin  Metadata.kt", from_kotlin(), model)
     errors += check_full_tuple("Swift   Metadata.swift", from_swift(), model)
-    errors += check_max_only("Go      operationRetryMax", from_go_max(), model)
-    errors += check_retry_on_only("Go      operationRetryOn", from_go_retry_on(), model)
+    go_max, go_retry_on = from_go()
+    errors += check_max_only("Go      operationRetryMax", go_max, model)
+    errors += check_retry_on_only("Go      operationRetryOn", go_retry_on, model)
 
     print("\nCriterion 2 — runtime consumption (token-smoke classification, not behavioral proof):")
     errors += check_runtime_consumption()